@@ -1,18 +1,25 @@
-from typing import cast
+import math
+from functools import lru_cache
 import numpy as np
 import polars as pl
 
 from units.units import Stress, SpecificWeight, Length
 from galatea.footings import Footing, Mat, FoundationShape
-from galatea.soil import Soil
+from galatea.soil import Soil, GAMMA_W
 
 # ------------------------------------------------------------------
 # Constants
 # ------------------------------------------------------------------
 
-_GAMMA_W = SpecificWeight(1, "g/cm³")  # Water unit weight
 _FACTOR_SEGURIDAD = 3.0
 
+# Terzaghi (1943) shape multipliers for (Nc, Nγ)
+_TERZAGHI_SHAPE_FACTORS = {
+    FoundationShape.continuous: (1.0, 0.5),
+    FoundationShape.square: (1.3, 0.4),
+    FoundationShape.circular: (1.3, 0.3),
+}
+
 # ------------------------------------------------------------------
 # Geometry & Soil Models
 # ------------------------------------------------------------------
@@ -23,35 +30,63 @@ _FACTOR_SEGURIDAD = 3.0
 # ------------------------------------------------------------------
 
 
-def _effective_overburden(soil: Soil, Df: Length) -> Stress:
+def _effective_overburden(soil: Soil, Df: Length) -> float:
     """
     Effective vertical stress at footing base. (Coduto, 2021)
-    Returns Stress.
+    Returns Pa.
     """
 
-    if soil.groundwater_table >= Df:
-        return cast(Stress, soil.gamma_nat * Df)
+    zw = soil.groundwater_table.value
+    D = Df.value
+    gamma_nat = soil.gamma_nat.value
 
-    gamma_sub = soil.gamma_sat - _GAMMA_W
+    if zw >= D:
+        return gamma_nat * D
 
-    return soil.gamma_nat * soil.groundwater_table + gamma_sub * (
-        Df - soil.groundwater_table
-    )
+    return gamma_nat * zw + soil.gamma_sub.value * (D - zw)
+
+
+def _corrected_gamma_for_Ngamma(soil: Soil, Df: Length, B: Length, zw: Length) -> float:
+    """
+    Unit weight for the Nγ term, corrected for groundwater. Returns N/m³.
+    """
+
+    gamma_sub = soil.gamma_sub.value
+
+    # Linear between γ' (NF at or above the base) and γ (NF at or below base + B)
+    t = min(max((zw.value - Df.value) / B.value, 0.0), 1.0)
 
+    return gamma_sub + t * (soil.gamma_nat.value - gamma_sub)
 
-def _corrected_gamma_for_Ngamma(
-    soil: Soil, Df: Length, B: Length, zw: Length
-) -> SpecificWeight:
-    gamma_sub = soil.gamma_sat - _GAMMA_W
 
-    if zw >= Df + B:
-        return soil.gamma_nat
+def _effective_overburden_array(
+    gamma_nat: np.ndarray, gamma_sat: np.ndarray, zw: np.ndarray, Df: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized `_effective_overburden` on SI floats (N/m³, m). Returns Pa.
+    """
 
-    if zw <= Df:
-        return gamma_sub
+    gamma_sub = gamma_sat - GAMMA_W.value
 
-    # NF entre la base y base + B
-    return gamma_sub + (zw - Df) / B * (soil.gamma_nat - gamma_sub)
+    return np.where(zw >= Df, gamma_nat * Df, gamma_nat * zw + gamma_sub * (Df - zw))
+
+
+def _corrected_gamma_for_Ngamma_array(
+    gamma_nat: np.ndarray,
+    gamma_sat: np.ndarray,
+    zw: np.ndarray,
+    Df: np.ndarray,
+    B: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized `_corrected_gamma_for_Ngamma` on SI floats. Returns N/m³.
+    """
+
+    gamma_sub = gamma_sat - GAMMA_W.value
+
+    t = np.clip((zw - Df) / B, 0.0, 1.0)
+
+    return gamma_sub + t * (gamma_nat - gamma_sub)
 
 
 # ------------------------------------------------------------------
@@ -65,11 +100,20 @@ def _local_shear_parameters(c: Stress, phi: float) -> tuple[Stress, float]:
     """
 
     c = c * 2 / 3
-    phi = np.degrees(np.atan(np.tan(np.radians(phi)) * 2 / 3))
+    phi = math.degrees(math.atan(math.tan(math.radians(phi)) * 2 / 3))
 
     return c, phi
 
 
+def _local_shear_phi_array(phi: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ɸ reduction for local shear failure. (Terzaghi, 1943)
+    """
+
+    return np.degrees(np.arctan(np.tan(np.radians(phi)) * 2 / 3))
+
+
+@lru_cache(maxsize=2048)
 def terzaghi_factors(phi: float) -> tuple[float, float, float]:
     """
     Terzaghi bearing capacity factors for general shear failure. (Coduto, 2021)
@@ -78,19 +122,64 @@ def terzaghi_factors(phi: float) -> tuple[float, float, float]:
     if phi == 0.0:
         return 5.7, 1.0, 0.0
 
-    phi_rad = np.radians(phi)
+    phi_rad = math.radians(phi)
+    tan_phi = math.tan(phi_rad)
 
-    a_theta = np.exp(np.pi * (0.75 - phi / 360) * np.tan(phi_rad))
+    a_theta = math.exp(math.pi * (0.75 - phi / 360) * tan_phi)
 
-    Nq = a_theta**2 / (2 * np.cos(np.radians(45) + phi_rad / 2) ** 2)
-    Nc = (Nq - 1) / np.tan(phi_rad)
+    Nq = a_theta**2 / (2 * math.cos(math.pi / 4 + phi_rad / 2) ** 2)
+    Nc = (Nq - 1) / tan_phi
     Ngamma = (
-        2 * (Nq + 1) * np.tan(phi_rad) / (1 + 0.4 * np.sin(4 * phi_rad))
+        2 * (Nq + 1) * tan_phi / (1 + 0.4 * math.sin(4 * phi_rad))
     )  # Fitted curve by Coduto
 
     return Nc, Nq, Ngamma
 
 
+def terzaghi_factors_array(
+    phi: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized `terzaghi_factors` over an array of ɸ in degrees, for
+    parametric sweeps. (Coduto, 2021)
+    """
+
+    phi = np.asarray(phi, dtype=np.float64)
+    phi_rad = np.radians(phi)
+    tan_phi = np.tan(phi_rad)
+    is_zero = phi == 0.0
+
+    a_theta = np.exp(np.pi * (0.75 - phi / 360) * tan_phi)
+
+    Nq = np.where(is_zero, 1.0, a_theta**2 / (2 * np.cos(np.pi / 4 + phi_rad / 2) ** 2))
+    Nc = np.where(is_zero, 5.7, (Nq - 1) / np.where(is_zero, 1.0, tan_phi))
+    Ngamma = 2 * (Nq + 1) * tan_phi / (1 + 0.4 * np.sin(4 * phi_rad))
+
+    return Nc, Nq, Ngamma
+
+
+def _terzaghi_qu_si(
+    phi: float,
+    c: float,
+    sigma_v_eff: float,
+    gamma_corr: float,
+    B: float,
+    shape: FoundationShape,
+) -> float:
+    """
+    Terzaghi σ_u on SI floats (Pa, N/m³, m). Returns Pa.
+    """
+
+    Nc, Nq, Ngamma = terzaghi_factors(phi)
+
+    try:
+        nc_mult, ng_mult = _TERZAGHI_SHAPE_FACTORS[shape]
+    except KeyError as e:
+        raise ValueError(f"Unsupported foundation shape: {shape}") from e
+
+    return c * (nc_mult * Nc) + sigma_v_eff * Nq + gamma_corr * B * (ng_mult * Ngamma)
+
+
 def terzaghi_bearing_capacity(
     foundation: Footing, soil: Soil, local_shear_failure: bool = True
 ) -> Stress:
@@ -120,39 +209,107 @@ def terzaghi_bearing_capacity(
 
     if local_shear_failure:
         c, phi = _local_shear_parameters(soil.c, soil.phi)
-        soil = Soil(
-            c,
-            phi,
-            gamma_nat=soil.gamma_nat,
-            gamma_sat=soil.gamma_sat,
-            groundwater_table=soil.groundwater_table,
-        )
+    else:
+        c, phi = soil.c, soil.phi
 
     zw = soil.groundwater_table
-    phi = soil.phi
-    c = soil.c
     D = foundation.Df
     B = foundation.width
     gamma_corr = _corrected_gamma_for_Ngamma(soil=soil, Df=D, B=B, zw=zw)
 
     sigma_v_eff = _effective_overburden(soil, D)
-    Nc, Nq, Ngamma = terzaghi_factors(phi)
 
-    print(gamma_corr.to("kg/m³"))
+    qu = _terzaghi_qu_si(
+        phi=phi,
+        c=c.value,
+        sigma_v_eff=sigma_v_eff,
+        gamma_corr=gamma_corr,
+        B=B.value,
+        shape=foundation.shape,
+    )
 
-    match foundation.shape:
-        case FoundationShape.continuous:
-            qu = c * Nc + sigma_v_eff * Nq + gamma_corr * B * (0.5 * Ngamma)
+    # reported in the display unit of the soil cohesion, as before
+    return Stress._make(qu, soil.c.user_unit)
 
-        case FoundationShape.square:
-            qu = c * (1.3 * Nc) + sigma_v_eff * Nq + gamma_corr * B * (0.4 * Ngamma)
 
-        case FoundationShape.circular:
-            qu = c * (1.3 * Nc) + sigma_v_eff * Nq + gamma_corr * B * (0.3 * Ngamma)
-        case _:
-            raise ValueError(f"Unsupported foundation shape: {foundation.shape}")
+def _terzaghi_shape_multipliers(
+    shape: FoundationShape | str | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Nc and Nγ shape multipliers for one shape or an array of shapes.
+    """
 
-    return qu
+    shapes = np.asarray(shape)
+
+    if shapes.dtype == object:
+        # enum members do not sort, so swap them for their string values
+        for member in FoundationShape:
+            shapes = np.where(shapes == member, member.value, shapes)
+        shapes = shapes.astype(str)
+
+    # resolve each distinct shape once, then gather per sample
+    unique, inverse = np.unique(shapes, return_inverse=True)
+    table = np.array([_TERZAGHI_SHAPE_FACTORS[FoundationShape(str(u))] for u in unique])
+    multipliers = table[inverse].reshape(shapes.shape + (2,))
+
+    return multipliers[..., 0], multipliers[..., 1]
+
+
+def terzaghi_bearing_capacity_batch(
+    phi: np.ndarray,
+    c: np.ndarray,
+    gamma_nat: np.ndarray,
+    gamma_sat: np.ndarray,
+    zw: np.ndarray,
+    Df: np.ndarray,
+    B: np.ndarray,
+    shape: FoundationShape | str | np.ndarray,
+    local_shear_failure: bool = True,
+) -> np.ndarray:
+    """
+    Vectorized `terzaghi_bearing_capacity` over arrays of soils and footings.
+
+    Parameters
+    ----------
+    phi : array_like
+        Friction angle ɸ in degrees.
+    c : array_like
+        Cohesion in Pa.
+    gamma_nat, gamma_sat : array_like
+        Natural and saturated unit weights in N/m³.
+    zw : array_like
+        Groundwater table depth in m.
+    Df, B : array_like
+        Foundation depth and width in m.
+    shape : FoundationShape, str or array_like
+        Footing shape, either shared by all samples or one per sample.
+    local_shear_failure : bool, optional
+        If True, applies local shear failure correction (Terzaghi, 1943).
+
+    Returns
+    -------
+    np.ndarray
+        Ultimate bearing capacity (σ_u) in Pa, broadcast over the inputs.
+    """
+
+    phi = np.asarray(phi, dtype=np.float64)
+    c = np.asarray(c, dtype=np.float64)
+    gamma_nat = np.asarray(gamma_nat, dtype=np.float64)
+    gamma_sat = np.asarray(gamma_sat, dtype=np.float64)
+    zw = np.asarray(zw, dtype=np.float64)
+    Df = np.asarray(Df, dtype=np.float64)
+    B = np.asarray(B, dtype=np.float64)
+
+    if local_shear_failure:
+        c = c * 2 / 3
+        phi = _local_shear_phi_array(phi)
+
+    gamma_corr = _corrected_gamma_for_Ngamma_array(gamma_nat, gamma_sat, zw, Df, B)
+    sigma_v_eff = _effective_overburden_array(gamma_nat, gamma_sat, zw, Df)
+    Nc, Nq, Ngamma = terzaghi_factors_array(phi)
+    nc_mult, ng_mult = _terzaghi_shape_multipliers(shape)
+
+    return c * (nc_mult * Nc) + sigma_v_eff * Nq + gamma_corr * B * (ng_mult * Ngamma)
 
 
 # ------------------------------------------------------------------
@@ -160,59 +317,154 @@ def terzaghi_bearing_capacity(
 # ------------------------------------------------------------------
 
 
+@lru_cache(maxsize=2048)
 def _general_factors(phi: float) -> tuple[float, float, float]:
     """
     Bearing capacity factors for general shear failure. (Das, 2019)
     """
 
-    phi_rad = np.radians(phi)
+    phi_rad = math.radians(phi)
 
     if phi == 0:
         return 5.14, 1, 0
 
-    Nq = np.exp(np.pi * np.tan(phi_rad)) * (np.tan(np.radians(45) + phi_rad / 2) ** 2)
-    Nc = (Nq - 1) / np.tan(phi_rad)
-    Ngamma = 2 * (Nq + 1) * np.tan(phi_rad)
+    tan_phi = math.tan(phi_rad)
+    tan_45 = math.tan(math.pi / 4 + phi_rad / 2)
+
+    Nq = math.exp(math.pi * tan_phi) * tan_45 * tan_45
+    Nc = (Nq - 1) / tan_phi
+    Ngamma = 2 * (Nq + 1) * tan_phi
 
     return Nc, Nq, Ngamma
 
 
-def _shape_depth_inclination_factors(Nq: float, Nc: float, foundation: Mat, soil: Soil):
+def _general_factors_array(
+    phi: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Outputs factors for the general bearing capacity equation. (Das, 2019)
+    Vectorized `_general_factors` over an array of ɸ in degrees.
     """
 
-    phi = soil.phi
+    phi = np.asarray(phi, dtype=np.float64)
     phi_rad = np.radians(phi)
+    tan_phi = np.tan(phi_rad)
+    is_zero = phi == 0.0
+
+    Nq = np.where(
+        is_zero, 1.0, np.exp(np.pi * tan_phi) * np.tan(np.pi / 4 + phi_rad / 2) ** 2
+    )
+    Nc = np.where(is_zero, 5.14, (Nq - 1) / np.where(is_zero, 1.0, tan_phi))
+    Ngamma = 2 * (Nq + 1) * tan_phi
+
+    return Nc, Nq, Ngamma
+
+
+def _shape_depth_inclination_factors(
+    Nq: float, Nc: float, phi: float, B: float, L: float, D: float, inclination: float
+):
+    """
+    Outputs factors for the general bearing capacity equation. (Das, 2019)
+    Dimensions are plain floats in a common length unit.
+    """
 
-    B = foundation.width.value
-    L = foundation.length.value
-    D = foundation.Df.value
-    inclination = foundation.inclination
+    phi_rad = math.radians(phi)
+    tan_phi = math.tan(phi_rad)
+    sin_phi = math.sin(phi_rad)
 
     # Shape factors (De Beer, 1970)
     S_c = 1 + (B / L) * (Nq / Nc)
-    S_q = 1 + (B / L) * np.tan(phi_rad)
+    S_q = 1 + (B / L) * tan_phi
     S_gamma = 1 - 0.4 * (B / L)
 
     # Depth factors (Hansen, 1970)
     if D / B <= 1:
         k = D / B
     else:
-        k = np.atan(D / B)
+        k = math.atan(D / B)
 
     D_c = 1 + 0.4 * k
-    D_q = 1 + 2 * np.tan(phi_rad) * (1 - np.sin(phi_rad)) ** 2 * k
+    D_q = 1 + 2 * tan_phi * (1 - sin_phi) ** 2 * k
     D_gamma = 1
 
     # Inclination factors (Meyerhof, 1963)
     I_q = (1 - inclination / 90) ** 2
     I_c = I_q
-    I_gamma = (1 - inclination / phi) ** 2
+    # Nγ = 0 for ɸ = 0, so the factor is irrelevant there; 1 avoids 0/0
+    I_gamma = (1 - inclination / phi) ** 2 if phi != 0 else 1.0
 
     return S_c, S_q, S_gamma, D_c, D_q, D_gamma, I_c, I_q, I_gamma
 
 
+def _shape_depth_inclination_factors_array(
+    Nq: np.ndarray,
+    Nc: np.ndarray,
+    phi: np.ndarray,
+    B: np.ndarray,
+    L: np.ndarray,
+    D: np.ndarray,
+    inclination: np.ndarray,
+):
+    """
+    Vectorized `_shape_depth_inclination_factors`.
+    """
+
+    phi_rad = np.radians(phi)
+    tan_phi = np.tan(phi_rad)
+    sin_phi = np.sin(phi_rad)
+
+    # Shape factors (De Beer, 1970)
+    S_c = 1 + (B / L) * (Nq / Nc)
+    S_q = 1 + (B / L) * tan_phi
+    S_gamma = 1 - 0.4 * (B / L)
+
+    # Depth factors (Hansen, 1970)
+    k = np.where(D / B <= 1, D / B, np.arctan(D / B))
+
+    D_c = 1 + 0.4 * k
+    D_q = 1 + 2 * tan_phi * (1 - sin_phi) ** 2 * k
+    D_gamma = 1
+
+    # Inclination factors (Meyerhof, 1963)
+    I_q = (1 - inclination / 90) ** 2
+    I_c = I_q
+    # Nγ = 0 for ɸ = 0, so the factor is irrelevant there; 1 avoids 0/0
+    is_zero = phi == 0
+    I_gamma = np.where(
+        is_zero, 1.0, (1 - inclination / np.where(is_zero, 1.0, phi)) ** 2
+    )
+
+    return S_c, S_q, S_gamma, D_c, D_q, D_gamma, I_c, I_q, I_gamma
+
+
+def _general_qu_si(
+    phi: float,
+    c: float,
+    sigma_v_eff: float,
+    gamma_corr: float,
+    B: float,
+    L: float,
+    D: float,
+    inclination: float,
+) -> float:
+    """
+    General bearing capacity σ_u on SI floats (Pa, N/m³, m). Returns Pa.
+    """
+
+    Nc, Nq, Ngamma = _general_factors(phi)
+
+    S_c, S_q, S_gamma, D_c, D_q, D_gamma, I_c, I_q, I_gamma = (
+        _shape_depth_inclination_factors(
+            Nq=Nq, Nc=Nc, phi=phi, B=B, L=L, D=D, inclination=inclination
+        )
+    )
+
+    return (
+        c * (Nc * S_c * D_c * I_c)
+        + sigma_v_eff * (Nq * S_q * D_q * I_q)
+        + gamma_corr * B * 0.5 * (Ngamma * S_gamma * D_gamma * I_gamma)
+    )
+
+
 def general_bearing_capacity(
     foundation: Mat, soil: Soil, local_shear_failure: bool = False
 ) -> Stress:
@@ -240,46 +492,115 @@ def general_bearing_capacity(
     """
     if local_shear_failure:
         c, phi = _local_shear_parameters(soil.c, soil.phi)
-        soil = Soil(
-            c,
-            phi,
-            gamma_nat=soil.gamma_nat,
-            gamma_sat=soil.gamma_sat,
-            groundwater_table=soil.groundwater_table,
-        )
+    else:
+        c, phi = soil.c, soil.phi
 
     zw = soil.groundwater_table
-    phi = soil.phi
-    c = soil.c
     D = foundation.Df
     B = foundation.width
     gamma_corr = _corrected_gamma_for_Ngamma(soil=soil, Df=D, B=B, zw=zw)
 
     sigma_v_eff = _effective_overburden(soil, foundation.Df)
-    Nc, Nq, Ngamma = _general_factors(phi)
+
+    qu = _general_qu_si(
+        phi=phi,
+        c=c.value,
+        sigma_v_eff=sigma_v_eff,
+        gamma_corr=gamma_corr,
+        B=B.value,
+        L=foundation.length.value,
+        D=D.value,
+        inclination=foundation.inclination,
+    )
+
+    # reported in the display unit of the soil cohesion, as before
+    return Stress._make(qu, soil.c.user_unit)
+
+
+def general_bearing_capacity_batch(
+    phi: np.ndarray,
+    c: np.ndarray,
+    gamma_nat: np.ndarray,
+    gamma_sat: np.ndarray,
+    zw: np.ndarray,
+    Df: np.ndarray,
+    B: np.ndarray,
+    L: np.ndarray,
+    inclination: np.ndarray = 0.0,
+    local_shear_failure: bool = False,
+) -> np.ndarray:
+    """
+    Vectorized `general_bearing_capacity` over arrays of soils and mats.
+
+    Parameters
+    ----------
+    phi : array_like
+        Friction angle ɸ in degrees.
+    c : array_like
+        Cohesion in Pa.
+    gamma_nat, gamma_sat : array_like
+        Natural and saturated unit weights in N/m³.
+    zw : array_like
+        Groundwater table depth in m.
+    Df, B, L : array_like
+        Foundation depth, width and length in m.
+    inclination : array_like, optional
+        Load inclination with respect to vertical, in degrees.
+    local_shear_failure : bool, optional
+        If True, applies local shear failure correction (Terzaghi, 1943).
+
+    Returns
+    -------
+    np.ndarray
+        Ultimate bearing capacity (σ_u) in Pa, broadcast over the inputs.
+    """
+
+    phi = np.asarray(phi, dtype=np.float64)
+    c = np.asarray(c, dtype=np.float64)
+    gamma_nat = np.asarray(gamma_nat, dtype=np.float64)
+    gamma_sat = np.asarray(gamma_sat, dtype=np.float64)
+    zw = np.asarray(zw, dtype=np.float64)
+    Df = np.asarray(Df, dtype=np.float64)
+    B = np.asarray(B, dtype=np.float64)
+    L = np.asarray(L, dtype=np.float64)
+    inclination = np.asarray(inclination, dtype=np.float64)
+
+    if local_shear_failure:
+        c = c * 2 / 3
+        phi = _local_shear_phi_array(phi)
+
+    gamma_corr = _corrected_gamma_for_Ngamma_array(gamma_nat, gamma_sat, zw, Df, B)
+    sigma_v_eff = _effective_overburden_array(gamma_nat, gamma_sat, zw, Df)
+    Nc, Nq, Ngamma = _general_factors_array(phi)
 
     S_c, S_q, S_gamma, D_c, D_q, D_gamma, I_c, I_q, I_gamma = (
-        _shape_depth_inclination_factors(
-            Nq=Nq,
-            Nc=Nc,
-            foundation=foundation,
-            soil=soil,
+        _shape_depth_inclination_factors_array(
+            Nq=Nq, Nc=Nc, phi=phi, B=B, L=L, D=Df, inclination=inclination
         )
     )
 
-    qu = (
+    return (
         c * (Nc * S_c * D_c * I_c)
         + sigma_v_eff * (Nq * S_q * D_q * I_q)
         + gamma_corr * B * 0.5 * (Ngamma * S_gamma * D_gamma * I_gamma)
     )
 
-    return qu
-
 
 # ------------------------------------------------------------------
 # Nq, Nc, Nγ tables
 # ------------------------------------------------------------------
 
+_TABLE_PHI = np.arange(0, 42)
+
+# (Nc, Nq, Nγ) columns for integer φ, computed once at import
+_TERZAGHI_TABLE = np.stack(terzaghi_factors_array(_TABLE_PHI), axis=1)
+_TERZAGHI_LOCAL_TABLE = np.stack(
+    terzaghi_factors_array(_local_shear_phi_array(_TABLE_PHI)), axis=1
+)
+_GENERAL_TABLE = np.stack(_general_factors_array(_TABLE_PHI), axis=1)
+
+_TABLE_SCHEMA = {"phi": pl.Int64, "Nc": pl.Float64, "Nq": pl.Float64, "Nγ": pl.Float64}
+
 
 def bearing_factors_table(
     method: str, local_shear_failure: bool = False
@@ -299,36 +620,16 @@ def bearing_factors_table(
         raise ValueError("Method must be 'Terzaghi' or 'General'.")
 
     if method == "Terzaghi":
-        if local_shear_failure:
-
-            def factors(phi: float):
-                _, phi_local = _local_shear_parameters(Stress(0, "kg/cm²"), phi)
-                return terzaghi_factors(phi_local)
-        else:
-
-            def factors(phi: float):
-                return terzaghi_factors(phi)
+        table = _TERZAGHI_LOCAL_TABLE if local_shear_failure else _TERZAGHI_TABLE
     else:
+        table = _GENERAL_TABLE
 
-        def factors(phi: float):
-            return _general_factors(phi)
-
-    rows = []
+    Nc, Nq, Ngamma = table.T
 
-    for phi in range(0, 42):
-        Nc, Nq, Ngamma = map(float, factors(phi))
-        rows.append(
-            {
-                "phi": phi,
-                "Nc": Nc,
-                "Nq": Nq,
-                "Nγ": Ngamma,
-            }
-        )
-
-    with pl.Config(set_tbl_rows=-1, set_tbl_cols=-1, set_float_precision=2):
-        df = pl.DataFrame(rows)
-        return df
+    return pl.DataFrame(
+        {"phi": _TABLE_PHI, "Nc": Nc, "Nq": Nq, "Nγ": Ngamma},
+        schema=_TABLE_SCHEMA,
+    )
 
 
 # ------------------------------------------------------------------
@@ -372,3 +673,8 @@ if __name__ == "__main__":
 
     print(f"σ_u  : {qu.to('kg/cm²'):.3f}")
     print(f"σ_adm: {q_adm.to('kg/cm²'):.3f}")
+
+    print("\nBearing factors (Terzaghi):\n" + "-" * 26)
+
+    with pl.Config(set_tbl_rows=-1, set_tbl_cols=-1, set_float_precision=2):
+        print(bearing_factors_table("Terzaghi"))
@@ -1,5 +1,7 @@
 from typing import TypedDict, Optional
 
+import polars as pl
+
 
 class SoilCharacteristics(TypedDict):
     """Particle size distribution and Atterberg limits (ASTM D2487)."""
@@ -27,6 +29,38 @@ class SoilCharacteristics(TypedDict):
     plastic_limit: Optional[float]
 
 
+# Gradation fractions summed into each coarse-grained group
+_GRAVEL_KEYS = ("passing_3in_retained_3_4in", "passing_3_4in_retained_4")
+_SAND_KEYS = (
+    "passing_4_retained_10",
+    "passing_10_retained_40",
+    "passing_40_retained_200",
+)
+
+# (fines band, gravel > sand, LL ≥ 50, PI ≥ 7) → group symbol
+# Fines band: 0 = < 5%, 1 = 5–12%, 2 = 12–50%, 3 = ≥ 50%
+# Flags that do not apply to a band are always False.
+_USCS_TABLE = {
+    # Clean gravel or sand
+    # (Simplified gradation assumption; real Cu/Cc check omitted)
+    (0, True, False, False): "GW",
+    (0, False, False, False): "SW",
+    # Dual symbol (some fines)
+    (1, True, False, False): "GW-GM",
+    (1, False, False, False): "SW-SM",
+    # With noticeable fines: clayey or silty
+    (2, True, False, True): "GC",
+    (2, True, False, False): "GM",
+    (2, False, False, True): "SC",
+    (2, False, False, False): "SM",
+    # Fine-grained soils
+    (3, False, False, True): "CL",  # Lean clay
+    (3, False, False, False): "ML",  # Silt
+    (3, False, True, True): "CH",  # Fat clay
+    (3, False, True, False): "MH",  # Elastic silt
+}
+
+
 def USCS(soil: SoilCharacteristics) -> str:
     """
     Classify soil according to the Unified Soil Classification System (USCS)
@@ -49,56 +83,100 @@ def USCS(soil: SoilCharacteristics) -> str:
     if fines is None:
         raise ValueError("Missing 'passing_200' (fines content).")
 
-    # --- Step 1: Coarse vs. Fine Grained ---
-    if fines < 50:
-        # Coarse-grained soils
-        coarse_gravel = soil.get("passing_3in_retained_3_4in") or 0.0
-        fine_gravel = soil.get("passing_3_4in_retained_4") or 0.0
-        coarse_sand = soil.get("passing_4_retained_10") or 0.0
-        medium_sand = soil.get("passing_10_retained_40") or 0.0
-        fine_sand = soil.get("passing_40_retained_200") or 0.0
-
-        gravel = coarse_gravel + fine_gravel
-        sand = coarse_sand + medium_sand + fine_sand
-
-        main_group = "G" if gravel > sand else "S"
-
-        # --- Step 2: Clean vs. With Fines ---
-        if fines < 5:
-            # Clean gravel or sand
-            # (Simplified gradation assumption; real Cu/Cc check omitted)
-            return f"{main_group}W"  # Well-graded
-        elif fines <= 12:
-            return f"{main_group}W-{main_group}M"  # Dual symbol (some fines)
-        else:
-            # With noticeable fines, need Atterberg limits
-            if LL is None or PL is None:
-                return f"{main_group} with fines (LL/PL missing)"
-            PI = LL - PL
-            if PI >= 7:
-                return f"{main_group}C"  # Clayey
-            else:
-                return f"{main_group}M"  # Silty
-
-    # --- Step 3: Fine-Grained Soils (≥ 50% fines) ---
+    # --- Step 1: Coarse vs. Fine Grained, Clean vs. With Fines ---
+    if fines < 5:
+        band = 0
+    elif fines <= 12:
+        band = 1
+    elif fines < 50:
+        band = 2
     else:
+        band = 3
+
+    gravelly = high_plasticity = clayey = False
+
+    if band < 3:
+        # Coarse-grained soils
+        gravel = sum(soil.get(k) or 0.0 for k in _GRAVEL_KEYS)
+        sand = sum(soil.get(k) or 0.0 for k in _SAND_KEYS)
+
+        gravelly = gravel > sand
+
+    # --- Step 2: Plasticity (only with noticeable fines) ---
+    if band >= 2:
         if LL is None or PL is None:
-            return "Fine-grained soil (LL/PL missing)"
-
-        PI = LL - PL
-
-        if LL < 50:
-            # Low plasticity range
-            if PI >= 7:
-                return "CL"  # Lean clay
-            else:
-                return "ML"  # Silt
-        else:
-            # High plasticity range
-            if PI >= 7:
-                return "CH"  # Fat clay
-            else:
-                return "MH"  # Elastic silt
+            if band == 3:
+                return "Fine-grained soil (LL/PL missing)"
+            return f"{'G' if gravelly else 'S'} with fines (LL/PL missing)"
+
+        clayey = LL - PL >= 7
+        high_plasticity = band == 3 and LL >= 50
+
+    return _USCS_TABLE[(band, gravelly, high_plasticity, clayey)]
+
+
+def _column(df: pl.DataFrame, name: str) -> pl.Expr:
+    """Float column expression, or a null literal if the column is absent."""
+    if name in df.columns:
+        return pl.col(name).cast(pl.Float64)
+    return pl.lit(None, dtype=pl.Float64)
+
+
+def USCS_batch(df: pl.DataFrame) -> pl.Series:
+    """
+    Vectorized `USCS` over a table of soil samples.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        One row per sample, with columns named after the `SoilCharacteristics`
+        keys. Missing gradation columns count as zero; missing Atterberg
+        limits yield the same fallback descriptions as `USCS`.
+
+    Returns
+    -------
+    pl.Series
+        USCS group symbol per sample, named "USCS".
+    """
+    fines = _column(df, "passing_200")
+    LL = _column(df, "liquid_limit")
+    PL = _column(df, "plastic_limit")
+
+    if df.select(fines.is_null().any()).item():
+        raise ValueError("Missing 'passing_200' (fines content).")
+
+    gravel = pl.sum_horizontal(_column(df, k).fill_null(0.0) for k in _GRAVEL_KEYS)
+    sand = pl.sum_horizontal(_column(df, k).fill_null(0.0) for k in _SAND_KEYS)
+
+    PI = LL - PL
+    limits_missing = LL.is_null() | PL.is_null()
+    main_group = pl.when(gravel > sand).then(pl.lit("G")).otherwise(pl.lit("S"))
+
+    # --- Coarse-grained soils (< 50% fines) ---
+    coarse = (
+        pl.when(fines < 5)
+        .then(pl.concat_str(main_group, pl.lit("W")))
+        .when(fines <= 12)
+        .then(pl.concat_str(main_group, pl.lit("W-"), main_group, pl.lit("M")))
+        .when(limits_missing)
+        .then(pl.concat_str(main_group, pl.lit(" with fines (LL/PL missing)")))
+        .when(PI >= 7)
+        .then(pl.concat_str(main_group, pl.lit("C")))
+        .otherwise(pl.concat_str(main_group, pl.lit("M")))
+    )
+
+    # --- Fine-grained soils (≥ 50% fines) ---
+    fine = (
+        pl.when(limits_missing)
+        .then(pl.lit("Fine-grained soil (LL/PL missing)"))
+        .when(LL < 50)
+        .then(pl.when(PI >= 7).then(pl.lit("CL")).otherwise(pl.lit("ML")))
+        .otherwise(pl.when(PI >= 7).then(pl.lit("CH")).otherwise(pl.lit("MH")))
+    )
+
+    return df.select(
+        pl.when(fines < 50).then(coarse).otherwise(fine).alias("USCS")
+    ).to_series()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
 import numpy as np
 
-from units import (
+from units.units import (
     StrainTensor,
+    StrainUnit,
     Stress,
     StressTensor,
     VolumetricEnergy,
 )
 
-
 # Material properties
 E = Stress(30, "MPa")  # 40,000,000 Pa
 nu = 0.3
@@ -30,15 +30,18 @@ def deformacion_elastica(E: Stress, nu: float, sigma: StressTensor) -> StrainTen
     """
     # Get raw floats (in Pa)
     sigma_vals = sigma.data
-    E_val = E.to_base_units()
+    E_val = E.value
 
     # Hooke's Law for Principal Stresses (Vectorized)
     # epsilon_i = (1/E) * [sigma_i - nu * (sum(sigma) - sigma_i)]
-    sum_sigma = np.sum(sigma_vals)
-    epsilon_vals = (1.0 / E_val) * (sigma_vals - nu * (sum_sigma - sigma_vals))
+    #           = (1/E) * [(1 + nu) * sigma_i - nu * sum(sigma)]
+    # evaluated in place on a single output buffer
+    epsilon_vals = sigma_vals * (1.0 + nu)
+    epsilon_vals -= nu * sigma_vals.sum()
+    epsilon_vals /= E_val
 
-    # Return as StrainTensor. Unit is dimensionless ("")
-    return StrainTensor.from_array(epsilon_vals, unit="")
+    # Return as StrainTensor, wrapping the buffer as is (strain is dimensionless)
+    return StrainTensor._from_base(epsilon_vals, StrainUnit.unitless)
 
 
 def energia_deformacion_volumetrica(
@@ -47,14 +50,15 @@ def energia_deformacion_volumetrica(
     """
     U = 1/2 * sum(sigma_i * epsilon_i)
     """
-    if len(sigma.data) != len(epsilon.data):
+    if sigma.shape != epsilon.shape:
         raise ValueError("Dimensions mismatch")
 
-    sigma_vals = sigma.data  # Pa
-    epsilon_vals = epsilon.data  # Dimensionless
-
     # Result is J/m^3 (equivalent to Pa)
-    U_value = 0.5 * np.sum(sigma_vals * epsilon_vals)
+    if sigma.data.ndim == 2:
+        # full tensors: contract σ_ij ε_ij without a temporary product array
+        U_value = 0.5 * float(np.einsum("ij,ij->", sigma.data, epsilon.data))
+    else:
+        U_value = 0.5 * float(np.dot(sigma.data, epsilon.data))
 
     return VolumetricEnergy(U_value, "J/m³")
 
@@ -75,17 +79,14 @@ print(f"\nEnergy 3: {U_3}")
 print("\n" + "-" * 40)
 
 
-sigma_1_matrix = StressTensor.from_array(np.diag(sigma_1_etapa.data), unit="kPa")
-sigma_1_matrix = sigma_1_matrix.convert("kPa")
-epsilon_1_matrix = StrainTensor.from_array(np.diag(epsilon_1_etapa.data), unit="")
+sigma_1_matrix = StressTensor(np.diag(sigma_1_etapa.data), "Pa").to("kPa")
+epsilon_1_matrix = StrainTensor(np.diag(epsilon_1_etapa.data), "")
 
-sigma_2_matrix = StressTensor.from_array(np.diag(sigma_2_etapa.data), unit="kPa")
-sigma_2_matrix = sigma_2_matrix.convert("kPa")
-epsilon_2_matrix = StrainTensor.from_array(np.diag(epsilon_2_etapa.data), unit="")
+sigma_2_matrix = StressTensor(np.diag(sigma_2_etapa.data), "Pa").to("kPa")
+epsilon_2_matrix = StrainTensor(np.diag(epsilon_2_etapa.data), "")
 
-sigma_3_matrix = StressTensor.from_array(np.diag(sigma_3_etapa.data), unit="kPa")
-sigma_3_matrix = sigma_3_matrix.convert("kPa")
-epsilon_3_matrix = StrainTensor.from_array(np.diag(epsilon_3_etapa.data), unit="")
+sigma_3_matrix = StressTensor(np.diag(sigma_3_etapa.data), "Pa").to("kPa")
+epsilon_3_matrix = StrainTensor(np.diag(epsilon_3_etapa.data), "")
 
 print(f"\nDiagonal Matrix from σ (1da etapa): {sigma_1_matrix}")
 print(f"\nDiagonal Matrix from ε (1da etapa): {epsilon_1_matrix}")
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from units.units import Stress, SpecificWeight, Length
 
+GAMMA_W = SpecificWeight(1, "g/cm³")  # Water unit weight
+
 
 @dataclass(frozen=True)
 class Soil:
@@ -9,3 +11,8 @@ class Soil:
     gamma_nat: SpecificWeight
     gamma_sat: SpecificWeight
     groundwater_table: Length
+    gamma_sub: SpecificWeight = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Submerged unit weight γ' = γ_sat - γ_w, used below the water table
+        object.__setattr__(self, "gamma_sub", self.gamma_sat - GAMMA_W)
@@ -0,0 +1,70 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+import pytest
+from units.units import Stress, Length, StressUnit
+
+
+def test_unit_parsing_by_name_and_display():
+    assert Stress(1, "kg_cm2") == Stress(1, "kg/cm²")
+    assert Stress(1, "kg_cm2").user_unit is StressUnit.kg_cm2
+    assert Stress(100, StressUnit.kPa).value == 100_000
+
+    with pytest.raises(ValueError):
+        Stress(1, "psi")
+
+
+def test_measure_is_frozen():
+    s = Stress(1, "kPa")
+
+    with pytest.raises(FrozenInstanceError):
+        s.value = 2
+
+    with pytest.raises(FrozenInstanceError):
+        del s.user_unit
+
+
+def test_measure_has_no_instance_dict():
+    assert not hasattr(Stress(1, "kPa"), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "clone", [copy.copy, copy.deepcopy, lambda m: pickle.loads(pickle.dumps(m))]
+)
+def test_measure_round_trip(clone):
+    s = Stress(2.5, "kg/cm²")
+    s2 = clone(s)
+
+    assert type(s2) is Stress
+    assert s2.value == s.value
+    assert s2.user_unit is StressUnit.kg_cm2
+
+
+def test_equality_and_hash():
+    assert Stress(1, "kPa") == Stress(1000, "Pa")
+    assert hash(Stress(1, "kPa")) == hash(Stress(1000, "Pa"))
+    assert len({Length(1, "m"), Length(100, "cm"), Length(2, "m")}) == 2
+
+    assert Stress(5, "Pa") == 5
+    assert Stress(1, "Pa") != "x"
+    assert Stress(1, "Pa") != Length(1, "m")
+
+
+def test_ordering():
+    assert Length(1, "m") > Length(50, "cm")
+    assert Length(1, "m") <= Length(100, "cm")
+
+    with pytest.raises(TypeError):
+        Length(1, "m") < Stress(1, "Pa")
+
+
+def test_scalar_arithmetic():
+    s = Stress(1, "kPa")
+
+    assert (s * 2).value == 2_000
+    assert (2.0 * s).value == 2_000
+    assert (s / np.float64(4)).value == 250
+    assert (s * True).user_unit is StressUnit.kPa
+    assert s / Stress(1, "Pa") == 1_000
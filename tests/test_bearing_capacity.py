@@ -0,0 +1,156 @@
+import numpy as np
+import polars as pl
+import pytest
+from units.units import Stress, Length, SpecificWeight
+from galatea.soil import Soil
+from galatea.footings import Footing, Mat
+from galatea.bearing_capacity import (
+    _general_factors,
+    _local_shear_parameters,
+    bearing_factors_table,
+    terzaghi_factors,
+    terzaghi_factors_array,
+    terzaghi_bearing_capacity,
+    terzaghi_bearing_capacity_batch,
+    general_bearing_capacity,
+    general_bearing_capacity_batch,
+)
+
+
+def _soil(phi: float, zw: float) -> Soil:
+    return Soil(
+        c=Stress(0.24, "kg/cm²"),
+        phi=phi,
+        gamma_nat=SpecificWeight(1.83, "g/cm³"),
+        gamma_sat=SpecificWeight(1.95, "g/cm³"),
+        groundwater_table=Length(zw, "m"),
+    )
+
+
+def test_terzaghi_factors_array_matches_scalar():
+    phi = np.linspace(0, 45, 91)
+    Nc, Nq, Ngamma = terzaghi_factors_array(phi)
+
+    for i, p in enumerate(phi):
+        assert (Nc[i], Nq[i], Ngamma[i]) == pytest.approx(terzaghi_factors(p))
+
+
+@pytest.mark.parametrize("local_shear_failure", [True, False])
+@pytest.mark.parametrize("shape", ["square", "continuous", "circular"])
+def test_terzaghi_batch_matches_scalar(shape, local_shear_failure):
+    soils = [_soil(phi, zw) for phi in (0.0, 14.1, 30.0) for zw in (0.5, 1.8, 10.0)]
+    footing = Footing(Df=Length(1, "m"), width=Length(1.5, "m"), shape=shape)
+
+    expected = [
+        terzaghi_bearing_capacity(footing, s, local_shear_failure).value for s in soils
+    ]
+
+    qu = terzaghi_bearing_capacity_batch(
+        phi=[s.phi for s in soils],
+        c=[s.c.value for s in soils],
+        gamma_nat=[s.gamma_nat.value for s in soils],
+        gamma_sat=[s.gamma_sat.value for s in soils],
+        zw=[s.groundwater_table.value for s in soils],
+        Df=1.0,
+        B=1.5,
+        shape=shape,
+        local_shear_failure=local_shear_failure,
+    )
+
+    assert qu == pytest.approx(expected)
+
+
+def test_terzaghi_batch_per_sample_shapes():
+    qu = terzaghi_bearing_capacity_batch(
+        phi=30.0,
+        c=0.0,
+        gamma_nat=18_000.0,
+        gamma_sat=20_000.0,
+        zw=100.0,
+        Df=1.0,
+        B=2.0,
+        shape=np.array(["continuous", "square", "circular"]),
+    )
+
+    assert qu.shape == (3,)
+    assert qu[0] > qu[1] > qu[2]
+
+
+def test_terzaghi_batch_invalid_shape():
+    with pytest.raises(ValueError):
+        terzaghi_bearing_capacity_batch(
+            30.0, 0.0, 18e3, 20e3, 10.0, 1.0, 2.0, "hexagon"
+        )
+
+
+@pytest.mark.parametrize("local_shear_failure", [True, False])
+def test_general_batch_matches_scalar(local_shear_failure):
+    soils = [_soil(phi, zw) for phi in (0.0, 14.1, 30.0) for zw in (0.3, 3.0, 10.0)]
+    mats = [
+        Mat(Df=Length(0.5, "m"), width=Length(6, "m"), length=Length(11, "m")),
+        Mat(
+            Df=Length(2.5, "m"),
+            width=Length(2, "m"),
+            length=Length(4, "m"),
+            inclination=10,
+        ),
+    ]
+
+    for mat in mats:
+        expected = [
+            general_bearing_capacity(mat, s, local_shear_failure).value for s in soils
+        ]
+
+        qu = general_bearing_capacity_batch(
+            phi=[s.phi for s in soils],
+            c=[s.c.value for s in soils],
+            gamma_nat=[s.gamma_nat.value for s in soils],
+            gamma_sat=[s.gamma_sat.value for s in soils],
+            zw=[s.groundwater_table.value for s in soils],
+            Df=mat.Df.value,
+            B=mat.width.value,
+            L=mat.length.value,
+            inclination=mat.inclination,
+            local_shear_failure=local_shear_failure,
+        )
+
+        assert qu == pytest.approx(expected)
+
+
+def test_scalar_results_keep_cohesion_unit():
+    soil = _soil(20.0, 3.0)
+    footing = Footing(Df=Length(1, "m"), width=Length(1.5, "m"), shape="square")
+    mat = Mat(Df=Length(1, "m"), width=Length(2, "m"), length=Length(4, "m"))
+
+    assert terzaghi_bearing_capacity(footing, soil).user_unit.display == "kg/cm²"
+    assert general_bearing_capacity(mat, soil).user_unit.display == "kg/cm²"
+
+
+def _local_terzaghi_factors(phi: float):
+    _, phi_local = _local_shear_parameters(Stress(0, "Pa"), phi)
+    return terzaghi_factors(phi_local)
+
+
+@pytest.mark.parametrize(
+    "method, local_shear_failure, factors",
+    [
+        ("Terzaghi", False, terzaghi_factors),
+        ("Terzaghi", True, _local_terzaghi_factors),
+        ("General", False, _general_factors),
+    ],
+)
+def test_bearing_factors_table(method, local_shear_failure, factors):
+    table = bearing_factors_table(method, local_shear_failure)
+
+    assert table.schema == pl.Schema(
+        {"phi": pl.Int64, "Nc": pl.Float64, "Nq": pl.Float64, "Nγ": pl.Float64}
+    )
+    assert table["phi"].to_list() == list(range(42))
+
+    for phi, Nc, Nq, Ngamma in table.iter_rows():
+        assert (Nc, Nq, Ngamma) == pytest.approx(factors(phi))
+
+
+def test_bearing_factors_table_invalid_method():
+    with pytest.raises(ValueError):
+        bearing_factors_table("Meyerhof")
@@ -0,0 +1,68 @@
+import polars as pl
+import pytest
+from galatea.classification import USCS, USCS_batch
+
+
+def _sample(fines, gravel, sand, LL, PL):
+    return {
+        "retained_12in": None,
+        "passing_12in_retained_3in": None,
+        "passing_3in_retained_3_4in": gravel / 2,
+        "passing_3_4in_retained_4": gravel / 2,
+        "passing_4_retained_10": sand / 3,
+        "passing_10_retained_40": sand / 3,
+        "passing_40_retained_200": None if sand == 0 else sand / 3,
+        "passing_200": fines,
+        "liquid_limit": LL,
+        "plastic_limit": PL,
+    }
+
+
+SAMPLES = [
+    _sample(3, 60, 37, None, None),
+    _sample(8, 20, 72, None, None),
+    _sample(30, 40, 30, 35, 20),
+    _sample(30, 20, 50, 30, 26),
+    _sample(20, 50, 30, None, 20),
+    _sample(60, 10, 30, 40, 20),
+    _sample(60, 10, 30, 40, 36),
+    _sample(80, 0, 20, 70, 30),
+    _sample(80, 0, 20, 70, 66),
+    _sample(50, 0, 0, None, None),
+]
+
+
+@pytest.mark.parametrize(
+    "sample, expected",
+    [
+        (_sample(3, 20, 77, None, None), "SW"),
+        (_sample(4.9, 60, 35.1, None, None), "GW"),
+        (_sample(5, 60, 35, None, None), "GW-GM"),
+        (_sample(12, 20, 68, None, None), "SW-SM"),
+        (_sample(12.1, 60, 27.9, 30, 26), "GM"),
+        (_sample(30, 20, 50, 35, 28), "SC"),
+        (_sample(30, 20, 50, 35, 28.1), "SM"),
+        (_sample(49.9, 30, 20.1, 40, 20), "GC"),
+        (_sample(30, 60, 10, None, 20), "G with fines (LL/PL missing)"),
+        (_sample(50, 0, 50, 40, 20), "CL"),
+        (_sample(60, 10, 30, 40, 36), "ML"),
+        (_sample(80, 0, 20, 50, 43), "CH"),
+        (_sample(80, 0, 20, 50, 44), "MH"),
+        (_sample(50, 20, 30, 45, None), "Fine-grained soil (LL/PL missing)"),
+    ],
+)
+def test_scalar_symbols(sample, expected):
+    assert USCS(sample) == expected
+
+
+def test_batch_matches_scalar():
+    df = pl.DataFrame(SAMPLES, infer_schema_length=None)
+    expected = [USCS(s) for s in SAMPLES]
+
+    assert USCS_batch(df).to_list() == expected
+
+
+def test_batch_missing_fines():
+    df = pl.DataFrame({"passing_200": [10.0, None]})
+    with pytest.raises(ValueError):
+        USCS_batch(df)
@@ -0,0 +1,23 @@
+import pytest
+from units.dimensions import Dimension
+
+
+def test_dimension_algebra():
+    force = Dimension(M=1, L=1, T=-2)
+
+    assert force / Dimension(L=2) == Dimension(M=1, L=-1, T=-2)
+    assert (force / force).is_dimensionless()
+
+
+def test_dimension_is_not_a_plain_tuple():
+    assert Dimension(M=1) != (1, 0, 0)
+    assert hash(Dimension(L=1)) == hash(Dimension(L=1))
+
+    with pytest.raises(TypeError):
+        Dimension(L=1) + Dimension(L=1)
+
+    with pytest.raises(TypeError):
+        2 * Dimension(M=1)
+
+    with pytest.raises(TypeError):
+        Dimension(M=1) < Dimension(L=1)
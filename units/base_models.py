@@ -1,9 +1,14 @@
 # units/base_models.py
 
 from __future__ import annotations
+import sys
 from enum import Enum
-from dataclasses import dataclass
-from typing import Type, overload, Self
+from numbers import Real
+from dataclasses import dataclass, FrozenInstanceError
+from types import MappingProxyType
+from typing import ClassVar, Mapping, Sequence, Type, overload, Self
+
+import numpy as np
 
 from units.dimensions import Dimension
 from units.registry import resolve_dimension, register_dimension
@@ -11,7 +16,8 @@ from units.registry import resolve_dimension, register_dimension
 
 class BaseUnit(Enum):
     def __init__(self, display: str, factor: float):
-        self.display = display
+        # interned so unit-table probes can match by identity
+        self.display = sys.intern(display)
         self.factor = factor
 
     def __str__(self):
@@ -25,12 +31,27 @@ class BaseUnit(Enum):
 
 class MeasureMeta(type):
     def __new__(mcls, name, bases, namespace):
+        # measures carry no per-instance __dict__ unless a subclass asks for one
+        namespace.setdefault("__slots__", ())
+
         cls = super().__new__(mcls, name, bases, namespace)
 
         dim = namespace.get("dimension")
         if dim is not None:
             register_dimension(dim, cls)
 
+        # unit lookup by display string or member name (names win on clashes)
+        unit_enum = namespace.get("_unit_enum")
+        if unit_enum is not None:
+            cls._units = MappingProxyType(
+                {
+                    **{m.display: m for m in unit_enum},
+                    **unit_enum.__members__,
+                }
+            )
+            # results resolved by dimension are expressed in the smallest unit
+            cls._base_unit = min(unit_enum, key=lambda u: u.factor)
+
         return cls
 
     def __getattr__(cls, name):
@@ -55,41 +76,67 @@ class MeasureMeta(type):
 # ----------------------------
 
 
-@dataclass(frozen=True)
 class BaseMeasure(metaclass=MeasureMeta):
-    value: float
-    dimension: Dimension
-    _unit_enum: Type[BaseUnit]
+    __slots__ = ("value", "user_unit")
+
+    value: float  # base units
     user_unit: BaseUnit
 
-    def __init__(self, value: float, unit: BaseUnit | str):
-        cls = self.__class__
+    dimension: ClassVar[Dimension]
+    _unit_enum: ClassVar[Type[BaseUnit]]
+    _units: ClassVar[Mapping[str, BaseUnit]]
+    _base_unit: ClassVar[BaseUnit]
+    _dim_hash: ClassVar[int]
+
+    def __init_subclass__(cls, **kwargs):
+        # checked once per class instead of on every construction
+        super().__init_subclass__(**kwargs)
 
         if not hasattr(cls, "_unit_enum") or not hasattr(cls, "dimension"):
             raise TypeError(f"{cls.__name__} must define _unit_enum and dimension")
 
-        unit_enum = cls._unit_enum
+        cls._dim_hash = hash(cls.dimension)
+
+    def __init__(self, value: float, unit: BaseUnit | str):
+        cls = self.__class__
 
         # resolve unit
-        if isinstance(unit, str):
-            if unit in unit_enum.__members__:
-                unit = unit_enum[unit]
-            else:
-                for m in unit_enum:
-                    if m.display == unit:
-                        unit = m
-                        break
-                else:
-                    raise ValueError(f"Invalid unit '{unit}'")
+        unit = cls._parse_unit(unit)
 
         # store base units
-        base_value = value * unit.factor
-
-        object.__setattr__(self, "value", base_value)
-        object.__setattr__(self, "dimension", cls.dimension)
-        object.__setattr__(self, "_unit_enum", unit_enum)
+        object.__setattr__(self, "value", value * unit.factor)
         object.__setattr__(self, "user_unit", unit)
 
+    @classmethod
+    def _make(cls, value: float, unit: BaseUnit) -> Self:
+        """Builds a measure from a base-unit value and an already resolved unit."""
+
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "value", value)
+        object.__setattr__(obj, "user_unit", unit)
+        return obj
+
+    # measures are immutable; slots are only written through object.__setattr__
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (self._make, (self.value, self.user_unit))
+
+    @classmethod
+    def _parse_unit(cls, unit: BaseUnit | str) -> BaseUnit:
+        if not isinstance(unit, str):
+            return unit
+
+        try:
+            return cls._units[unit]
+        except KeyError:
+            raise ValueError(f"Invalid unit '{unit}'") from None
+
     # ----------------------------
     # Formatting
     # ----------------------------
@@ -110,22 +157,14 @@ class BaseMeasure(metaclass=MeasureMeta):
         unit_enum = self._unit_enum
 
         # resolve string → enum
-        if isinstance(unit, str):
-            if unit in unit_enum.__members__:
-                unit = unit_enum[unit]
-            else:
-                for m in unit_enum:
-                    if m.display == unit:
-                        unit = m
-                        break
-                else:
-                    raise ValueError(f"Invalid unit '{unit}'")
+        unit = self._parse_unit(unit)
 
         # validate
         if not isinstance(unit, unit_enum):
             raise TypeError("Invalid unit")
 
-        return self.__class__(self.value / unit.factor, unit)
+        # the base value is unit independent, only the display unit changes
+        return self._make(self.value, unit)
 
     def _resolve(self, value: float, dim: Dimension):
         cls = resolve_dimension(dim)
@@ -137,32 +176,35 @@ class BaseMeasure(metaclass=MeasureMeta):
                 f"Try adding parentheses, e.g. s * (L / L) instead of s * L / L."
             )
 
-        base_unit = min(cls._unit_enum, key=lambda u: u.factor)
-        return cls(value / base_unit.factor, base_unit)
+        return cls._make(value, cls._base_unit)
 
     # ----------------------------
     # Algebra
     # ----------------------------
 
     def __add__(self, other):
+        if type(other) is type(self):
+            return self._make(self.value + other.value, self.user_unit)
+
         if not isinstance(other, BaseMeasure):
             return NotImplemented
 
         if self.dimension != other.dimension:
             raise TypeError("Cannot add measures with different dimensions")
 
-        base_sum = self.value + other.value
-        return self.__class__(base_sum / self.user_unit.factor, self.user_unit)
+        return self._make(self.value + other.value, self.user_unit)
 
     def __sub__(self, other):
+        if type(other) is type(self):
+            return self._make(self.value - other.value, self.user_unit)
+
         if not isinstance(other, BaseMeasure):
             return NotImplemented
 
         if self.dimension != other.dimension:
             raise TypeError("Cannot subtract measures with different dimensions")
 
-        base_diff = self.value - other.value
-        return self.__class__(base_diff / self.user_unit.factor, self.user_unit)
+        return self._make(self.value - other.value, self.user_unit)
 
     @overload
     def __mul__(self, other: int | float) -> Self: ...
@@ -171,10 +213,9 @@ class BaseMeasure(metaclass=MeasureMeta):
     def __mul__(self, other: "BaseMeasure") -> BaseMeasure: ...
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
-            return self.__class__(
-                (self.value * other) / self.user_unit.factor, self.user_unit
-            )
+        t = type(other)
+        if t is float or t is int:
+            return self._make(self.value * other, self.user_unit)
 
         if isinstance(other, BaseMeasure):
             return self._resolve(
@@ -182,6 +223,10 @@ class BaseMeasure(metaclass=MeasureMeta):
                 self.dimension * other.dimension,
             )
 
+        # int/float subclasses such as bool or np.float64
+        if isinstance(other, (int, float)):
+            return self._make(self.value * other, self.user_unit)
+
         return NotImplemented
 
     @overload
@@ -191,10 +236,9 @@ class BaseMeasure(metaclass=MeasureMeta):
     def __truediv__(self, other: "BaseMeasure") -> float | BaseMeasure: ...
 
     def __truediv__(self, other):
-        if isinstance(other, (int, float)):
-            return self.__class__(
-                (self.value / other) / self.user_unit.factor, self.user_unit
-            )
+        t = type(other)
+        if t is float or t is int:
+            return self._make(self.value / other, self.user_unit)
 
         if isinstance(other, BaseMeasure):
             dim = self.dimension / other.dimension
@@ -205,6 +249,10 @@ class BaseMeasure(metaclass=MeasureMeta):
 
             return self._resolve(val, dim)
 
+        # int/float subclasses such as bool or np.float64
+        if isinstance(other, (int, float)):
+            return self._make(self.value / other, self.user_unit)
+
         return NotImplemented
 
     def __rmul__(self, other):
@@ -222,19 +270,247 @@ class BaseMeasure(metaclass=MeasureMeta):
         return float(other)
 
     def __eq__(self, other):
-        try:
-            return abs(self.value - self._cmp_value(other)) < 1e-9
-        except TypeError:
-            return False
+        if isinstance(other, BaseMeasure):
+            if self.dimension != other.dimension:
+                return False
+            return abs(self.value - other.value) < 1e-9
+
+        if isinstance(other, (int, float)):
+            return abs(self.value - other) < 1e-9
+
+        return NotImplemented
+
+    def __hash__(self):
+        # display unit is excluded so that 1 kPa and 1000 Pa hash alike.
+        # __eq__ is looser than this hash: it allows a 1e-9 tolerance and
+        # equals bare numbers, so only exactly equal base values hash alike.
+        return hash(self.value) ^ self._dim_hash
+
+    # same-class operands share a dimension, so skip the check for them
 
     def __lt__(self, other):
+        if type(other) is type(self):
+            return self.value < other.value
         return self.value < self._cmp_value(other)
 
     def __le__(self, other):
+        if type(other) is type(self):
+            return self.value <= other.value
         return self.value <= self._cmp_value(other)
 
     def __gt__(self, other):
+        if type(other) is type(self):
+            return self.value > other.value
         return self.value > self._cmp_value(other)
 
     def __ge__(self, other):
+        if type(other) is type(self):
+            return self.value >= other.value
         return self.value >= self._cmp_value(other)
+
+
+# ----------------------------
+# BaseTensor
+# ----------------------------
+
+
+@dataclass(frozen=True, eq=False)
+class BaseTensor:
+    """
+    Array of measures of a single kind.
+
+    Values live in one float64 ndarray in base units, with a single unit
+    shared by all elements for display.
+    """
+
+    data: np.ndarray
+    user_unit: BaseUnit
+
+    _measure: ClassVar[Type[BaseMeasure]]
+
+    # opt out of NumPy's operator protocol so that e.g. np.float64 * tensor
+    # defers to __rmul__ instead of broadcasting over the tensor as an object
+    __array_ufunc__ = None
+
+    def __init__(self, data, unit: BaseUnit | str):
+        unit = self._measure._parse_unit(unit)
+
+        # asarray avoids a copy for float64 input; the multiply yields a new array
+        data = np.multiply(np.asarray(data, dtype=np.float64), unit.factor)
+
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "user_unit", unit)
+
+    @classmethod
+    def _from_base(cls, data: np.ndarray, unit: BaseUnit) -> Self:
+        """
+        Wraps a float64 array already in base units, skipping conversion.
+
+        The array is stored as is, not copied.
+        """
+
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "data", data)
+        object.__setattr__(obj, "user_unit", unit)
+        return obj
+
+    @classmethod
+    def from_list(
+        cls, measures: Sequence[BaseMeasure] | Sequence[Sequence[BaseMeasure]]
+    ) -> Self:
+        """
+        Builds a tensor from measures, displayed in the unit of the first one.
+
+        A list of equal-length rows gives a 2-D tensor.
+        """
+
+        shape: tuple[int, ...] = (len(measures),)
+        flat = measures
+
+        if measures and isinstance(measures[0], (list, tuple)):
+            ncols = len(measures[0])
+            if any(len(row) != ncols for row in measures):
+                raise ValueError("All rows must have the same length")
+
+            shape = (len(measures), ncols)
+            flat = [m for row in measures for m in row]
+
+        if not flat:
+            raise ValueError("Cannot build a tensor from an empty list")
+
+        # exact type: subclasses such as VolumetricEnergy use other unit enums
+        for m in flat:
+            if type(m) is not cls._measure:
+                raise TypeError(
+                    f"{cls.__name__} elements must be {cls._measure.__name__}"
+                )
+
+        data = np.fromiter((m.value for m in flat), dtype=np.float64, count=len(flat))
+        return cls._from_base(data.reshape(shape), flat[0].user_unit)
+
+    # ----------------------------
+    # Container
+    # ----------------------------
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.data.shape
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        result = self.data[key]
+
+        if np.ndim(result) == 0:
+            return self._measure._make(float(result), self.user_unit)
+
+        return self._from_base(result, self.user_unit)
+
+    # ----------------------------
+    # Formatting & Conversion
+    # ----------------------------
+
+    def __repr__(self):
+        return f"{self.values()} {self.user_unit.display}"
+
+    def values(self, unit: BaseUnit | str | None = None) -> np.ndarray:
+        """Data expressed in `unit` (the display unit by default) as a new array."""
+
+        unit = self.user_unit if unit is None else self._measure._parse_unit(unit)
+
+        if not isinstance(unit, self._measure._unit_enum):
+            raise TypeError("Invalid unit")
+
+        return self.data / unit.factor
+
+    # ----------------------------
+    # Algebra
+    # ----------------------------
+
+    def _operand(self, other, action: str):
+        """Base-unit data of a same-dimension tensor or measure, else None."""
+
+        if isinstance(other, BaseTensor):
+            if not self._same_dimension(other):
+                raise TypeError(f"Cannot {action} tensors with different dimensions")
+            return other.data
+
+        if isinstance(other, BaseMeasure):
+            if self._measure.dimension != other.dimension:
+                raise TypeError(f"Cannot {action} measures with different dimensions")
+            return other.value
+
+        return None
+
+    def __add__(self, other):
+        operand = self._operand(other, "add")
+        if operand is None:
+            return NotImplemented
+
+        return self._from_base(np.add(self.data, operand), self.user_unit)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        operand = self._operand(other, "subtract")
+        if operand is None:
+            return NotImplemented
+
+        return self._from_base(np.subtract(self.data, operand), self.user_unit)
+
+    def __rsub__(self, other):
+        operand = self._operand(other, "subtract")
+        if operand is None:
+            return NotImplemented
+
+        return self._from_base(np.subtract(operand, self.data), self.user_unit)
+
+    def __mul__(self, other):
+        if isinstance(other, Real):
+            return self._from_base(np.multiply(self.data, other), self.user_unit)
+
+        return NotImplemented
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, Real):
+            return self._from_base(np.true_divide(self.data, other), self.user_unit)
+
+        return NotImplemented
+
+    # ----------------------------
+    # Comparisons
+    # ----------------------------
+
+    def _same_dimension(self, other) -> bool:
+        return (
+            isinstance(other, BaseTensor)
+            and self._measure.dimension == other._measure.dimension
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, BaseTensor):
+            return NotImplemented
+
+        return self._same_dimension(other) and np.array_equal(self.data, other.data)
+
+    def eq_array(self, other: BaseTensor) -> np.ndarray:
+        """Element-wise equality in base units, as a boolean ndarray."""
+
+        if not self._same_dimension(other):
+            raise TypeError("Cannot compare different dimensions")
+
+        return self.data == other.data
+
+    def to(self, unit: BaseUnit | str) -> Self:
+        unit_enum = self._measure._unit_enum
+        unit = self._measure._parse_unit(unit)
+
+        if not isinstance(unit, unit_enum):
+            raise TypeError("Invalid unit")
+
+        return self._from_base(self.data, unit)
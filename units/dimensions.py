@@ -1,20 +1,41 @@
 # units/dimensions.py
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class Dimension:
+class Dimension(NamedTuple):
+    # a tuple subclass, so hashing runs in C; used as registry key.
+    # Equality is a Python method that only matches other Dimensions.
     M: int = 0
     L: int = 0
     T: int = 0
 
     def __mul__(self, other: "Dimension") -> "Dimension":
+        if not isinstance(other, Dimension):
+            return NotImplemented
         return Dimension(self.M + other.M, self.L + other.L, self.T + other.T)
 
     def __truediv__(self, other: "Dimension") -> "Dimension":
+        if not isinstance(other, Dimension):
+            return NotImplemented
         return Dimension(self.M - other.M, self.L - other.L, self.T - other.T)
 
+    # tuple behaviour that makes no sense for dimensions is disabled
+
+    def __eq__(self, other):
+        return isinstance(other, Dimension) and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not (isinstance(other, Dimension) and tuple.__eq__(self, other))
+
+    __hash__ = tuple.__hash__
+
+    def _unsupported(self, other):
+        raise TypeError("Unsupported operation for Dimension")
+
+    __add__ = __radd__ = __rmul__ = _unsupported
+    __lt__ = __le__ = __gt__ = __ge__ = _unsupported
+
     def is_dimensionless(self) -> bool:
         return self.M == self.L == self.T == 0
 
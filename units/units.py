@@ -1,6 +1,6 @@
 # units/measures.py
 
-from units.base_models import BaseMeasure, BaseUnit
+from units.base_models import BaseMeasure, BaseTensor, BaseUnit
 from units.dimensions import Dimension
 
 # --- Dimensions ---
@@ -63,6 +63,15 @@ class SpecificWeightUnit(BaseUnit):
     Kg_m3 = ("kg/m³", 9.8066500286389)
 
 
+class StrainUnit(BaseUnit):
+    unitless = ("", 1)
+
+
+class VolumetricEnergyUnit(BaseUnit):
+    J_m3 = ("J/m³", 1)
+    kJ_m3 = ("kJ/m³", 1e3)
+
+
 # --- Measures ---
 
 
@@ -107,4 +116,22 @@ class SpecificWeight(BaseMeasure):
 
 
 class Strain(BaseMeasure):
+    _unit_enum = StrainUnit
     dimension = STRAIN
+
+
+class VolumetricEnergy(Stress):
+    # Energy per unit volume shares the dimension of Stress; inheriting it
+    # (rather than declaring it) keeps Stress as the registered result type.
+    _unit_enum = VolumetricEnergyUnit
+
+
+# --- Tensors ---
+
+
+class StressTensor(BaseTensor):
+    _measure = Stress
+
+
+class StrainTensor(BaseTensor):
+    _measure = Strain